@@ -15,54 +15,82 @@ class BarGram(object):
     ):
         self.__midi_df_list = midi_df_list
         df = pd.concat(self.__midi_df_list)
-        self.__min_pitch = df.pitch.min()
-        self.__max_pitch = df.pitch.max()
-        self.__min_velocity = df.velocity.min()
-        self.__max_velocity = df.velocity.max()
+        stat_arr = df[["pitch", "velocity"]].values
+        min_arr = stat_arr.min(axis=0)
+        max_arr = stat_arr.max(axis=0)
+        self.__min_pitch = min_arr[0]
+        self.__max_pitch = max_arr[0]
+        self.__min_velocity = min_arr[1]
+        self.__max_velocity = max_arr[1]
         self.__program_list = df.program.drop_duplicates().values.tolist()
         self.__time_fraction = time_fraction
 
-        self.__create_bar_gram()
+        self.__create_bar_gram(df)
 
     def extract_features(self, df):
-        pitch_tuple = tuple(df.pitch.values.tolist())
+        return self.extract_features_by_pitch_arr(df.pitch.values)
+
+    def extract_features_by_pitch_arr(self, pitch_arr):
+        '''
+        Extract features from pitches in a bar.
+
+        Args:
+            pitch_arr:    `np.ndarray` of pitches in a bar.
+
+        Returns:
+            `np.ndarray` of feature points.
+        '''
+        pitch_tuple = tuple(pitch_arr.tolist())
         arr = np.zeros(self.__dim)
         try:
-            arr[self.pitch_tuple_list.index(pitch_tuple)] = 1
-        except ValueError:
+            arr[self.__pitch_tuple_key_dict[pitch_tuple]] = 1
+        except KeyError:
             pitch_key = np.random.randint(low=0, high=len(self.pitch_tuple_list))
             arr[pitch_key] = 1
 
-        arr = arr.astype(float)
         return arr
 
     def __extract_bar_gram(self, midi_df):
-        start = 0
+        pitch_arr = midi_df.pitch.values
+        sorted_key_arr = np.argsort(midi_df.start.values, kind="stable")
+        start_arr = midi_df.start.values[sorted_key_arr]
+        end_max = midi_df.end.max()
+
+        boundary_list = [0]
         end = self.__time_fraction
+        while end < end_max:
+            boundary_list.append(end)
+            end += self.__time_fraction
+
+        boundary_key_arr = np.searchsorted(start_arr, np.array(boundary_list), side="left")
+
         pitch_tuple_list = []
-        while end < midi_df.end.max():
-            df = midi_df[(start <= midi_df.start) & (midi_df.start <= end)]
-            df = df[(df.start < end)]
-            pitch_tuple = tuple(df.pitch.values.tolist())
-            if pitch_tuple not in pitch_tuple_list:
+        pitch_tuple_set = set()
+        for i in range(boundary_key_arr.shape[0] - 1):
+            key_arr = np.sort(sorted_key_arr[boundary_key_arr[i]:boundary_key_arr[i+1]])
+            pitch_tuple = tuple(pitch_arr[key_arr].tolist())
+            if pitch_tuple not in pitch_tuple_set:
+                pitch_tuple_set.add(pitch_tuple)
                 pitch_tuple_list.append(pitch_tuple)
-            start += self.__time_fraction
-            end += self.__time_fraction
 
         return pitch_tuple_list
 
-    def __create_bar_gram(self):
+    def __create_bar_gram(self, df):
         pitch_tuple_list = []
         for i in range(len(self.__midi_df_list)):
             pitch_tuple_list.extend(
                 self.__extract_bar_gram(self.__midi_df_list[i])
             )
-        df = pd.concat(self.__midi_df_list)
         pitch_list = [(v, ) for v in df.pitch.drop_duplicates().values.tolist()]
         pitch_tuple_list.extend(pitch_list)
         self.__dim = len(pitch_tuple_list)
         self.__pitch_tuple_list = pitch_tuple_list
 
+        pitch_tuple_key_dict = {}
+        for key in range(len(pitch_tuple_list)):
+            pitch_tuple_key_dict.setdefault(pitch_tuple_list[key], key)
+        self.__pitch_tuple_key_dict = pitch_tuple_key_dict
+
     def set_readonly(self, value):
         ''' setter '''
         raise TypeError()
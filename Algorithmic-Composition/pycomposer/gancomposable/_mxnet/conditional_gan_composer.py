@@ -422,20 +422,18 @@ class ConditionalGANComposer(GANComposable):
         generated_list = []
         start = 0
         end = self.__time_fraction
+        pitch_key_arr = np.argmax(generated_arr, axis=3)
+        pitch_tuple_list = self.__bar_gram.pitch_tuple_list
+        program_list = self.__true_sampler.program_list
         for batch in range(generated_arr.shape[0]):
             for seq in range(generated_arr.shape[2]):
                 add_flag = False
                 for program_key in range(generated_arr.shape[1]):
-                    pitch_key = np.argmax(generated_arr[batch, program_key, seq])
-                    pitch_tuple = self.__bar_gram.pitch_tuple_list[pitch_key]
+                    pitch_key = pitch_key_arr[batch, program_key, seq]
+                    pitch_tuple = pitch_tuple_list[pitch_key]
+                    program = program_list[program_key]
                     for pitch in pitch_tuple:
-                        velocity = np.random.normal(
-                            loc=velocity_mean, 
-                            scale=velocity_std
-                        )
-                        velocity = int(velocity)
-                        program = self.__true_sampler.program_list[program_key]
-                        generated_list.append((program, start, end, pitch, velocity))
+                        generated_list.append((program, start, end, pitch))
                         add_flag = True
 
                 if add_flag is True:
@@ -443,28 +441,35 @@ class ConditionalGANComposer(GANComposable):
                     end += self.__time_fraction
 
         generated_midi_df = pd.DataFrame(
-            generated_list, 
+            generated_list,
             columns=[
                 "program",
-                "start", 
-                "end", 
-                "pitch", 
-                "velocity"
+                "start",
+                "end",
+                "pitch"
             ]
         )
-
-        pitch_arr = generated_midi_df.pitch.drop_duplicates()
-        df_list = []
-        for pitch in pitch_arr:
-            df = generated_midi_df[generated_midi_df.pitch == pitch]
-            df = df.sort_values(by=["start", "end"])
-            df["next_start"] = df.start.shift(-1)
-            df["next_end"] = df.end.shift(-1)
-            df.loc[df.end == df.next_start, "end"] = df.loc[df.end == df.next_start, "next_end"]
-            df = df.drop_duplicates(["end"])
-            df_list.append(df)
-
-        generated_midi_df = pd.concat(df_list)
+        generated_midi_df["velocity"] = np.random.normal(
+            loc=velocity_mean,
+            scale=velocity_std,
+            size=generated_midi_df.shape[0]
+        ).astype(int)
+
+        sort_key_arr = np.lexsort((
+            generated_midi_df.end.values,
+            generated_midi_df.start.values,
+            generated_midi_df.pitch.values
+        ))
+        generated_midi_df = generated_midi_df.iloc[sort_key_arr]
+
+        pitch_arr = generated_midi_df.pitch.values
+        start_arr = generated_midi_df.start.values
+        end_arr = generated_midi_df.end.values.copy()
+        merge_key_arr = (pitch_arr[:-1] == pitch_arr[1:]) & (end_arr[:-1] == start_arr[1:])
+        end_arr[:-1][merge_key_arr] = end_arr[1:][merge_key_arr]
+        generated_midi_df["end"] = end_arr
+
+        generated_midi_df = generated_midi_df.drop_duplicates(["pitch", "end"])
         generated_midi_df = generated_midi_df.sort_values(by=["start", "end"])
 
         self.__midi_controller.save(
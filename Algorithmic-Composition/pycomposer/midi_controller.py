@@ -24,10 +24,21 @@ class MidiController(object):
         for instrument in midi_data.instruments:
             if (is_drum is False and instrument.is_drum is False) or (is_drum is True and instrument.is_drum is True):
                 for note in instrument.notes:
-                    note_tuple_list.append((instrument.program, note.start, note.end, note.pitch, note.velocity))
-        note_df = pd.DataFrame(note_tuple_list, columns=["program", "start", "end", "pitch", "velocity"])
+                    note_tuple_list.append(
+                        (
+                            instrument.program,
+                            note.start,
+                            note.end,
+                            note.pitch,
+                            note.velocity,
+                            note.end - note.start
+                        )
+                    )
+        note_df = pd.DataFrame(
+            note_tuple_list,
+            columns=["program", "start", "end", "pitch", "velocity", "duration"]
+        )
         note_df = note_df.sort_values(by=["program", "start", "end"])
-        note_df["duration"] = note_df.end - note_df.start
 
         return note_df
 
@@ -45,12 +56,16 @@ class MidiController(object):
         for program in note_df.program.drop_duplicates().values.tolist():
             df = note_df[note_df.program == program]
             midi_obj = pretty_midi.Instrument(program=program)
+            velocity_arr = df.velocity.values
+            pitch_arr = df.pitch.values
+            start_arr = df.start.values
+            end_arr = df.end.values
             for i in range(df.shape[0]):
                 note = pretty_midi.Note(
-                    velocity=int(df.iloc[i, :]["velocity"]),
-                    pitch=int(df.iloc[i, :]["pitch"]),
-                    start=float(df.iloc[i, :]["start"]), 
-                    end=float(df.iloc[i, :]["end"])
+                    velocity=int(velocity_arr[i]),
+                    pitch=int(pitch_arr[i]),
+                    start=float(start_arr[i]),
+                    end=float(end_arr[i])
                 )
                 # Add it to our cello instrument
                 midi_obj.notes.append(note)
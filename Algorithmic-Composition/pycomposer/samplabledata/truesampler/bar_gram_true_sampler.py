@@ -42,12 +42,35 @@ class BarGramTrueSampler(TrueSampler):
             )
         program_list = list(set(program_list))
 
+        midi_program_tuple_dict = {}
+        for key in range(len(self.__midi_df_list)):
+            for program_key in program_list:
+                midi_df = self.__midi_df_list[key]
+                program_df = midi_df[midi_df.program == program_key]
+                program_df = program_df.sort_values(by=["start"], kind="stable")
+                start_arr = program_df.start.values
+                if start_arr.shape[0] > 0:
+                    row_low = start_arr[0]
+                    row_high = program_df.end.max() - (seq_len * time_fraction)
+                else:
+                    row_low = None
+                    row_high = None
+                midi_program_tuple_dict[(key, program_key)] = (
+                    start_arr,
+                    program_df.pitch.values,
+                    row_low,
+                    row_high
+                )
+        self.__midi_program_tuple_dict = midi_program_tuple_dict
+
         self.__batch_size = batch_size
         self.__seq_len = seq_len
         self.__channel = len(program_list)
         self.__program_list = program_list
         self.__time_fraction = time_fraction
         self.__dim = self.__bar_gram.dim
+        self.__seq_boundary_arr = np.arange(seq_len + 1) * time_fraction
+        self.__sampled_buffer = None
 
     def draw(self):
         '''
@@ -59,33 +82,44 @@ class BarGramTrueSampler(TrueSampler):
         return self.__create_samples()
 
     def __create_samples(self):
-        sampled_arr = np.zeros((self.__batch_size, self.__channel, self.__seq_len, self.__dim))
+        if self.__sampled_buffer is None:
+            self.__sampled_buffer = np.zeros(
+                (self.__batch_size, self.__channel, self.__seq_len, self.__dim),
+                dtype=np.float32
+            )
+        else:
+            self.__sampled_buffer.fill(0.0)
+        sampled_arr = self.__sampled_buffer
+
+        key_arr = np.random.randint(
+            low=0,
+            high=len(self.__midi_df_list),
+            size=(self.__batch_size, len(self.__program_list))
+        )
+        row_arr = np.random.uniform(size=(self.__batch_size, len(self.__program_list)))
 
         for batch in range(self.__batch_size):
             for i in range(len(self.__program_list)):
                 program_key = self.__program_list[i]
-                key = np.random.randint(low=0, high=len(self.__midi_df_list))
-                midi_df = self.__midi_df_list[key]
-
-                midi_df = midi_df[midi_df.program == program_key]
-                if midi_df.shape[0] < self.__seq_len:
+                key = key_arr[batch, i]
+                start_arr, pitch_arr, row_low, row_high = self.__midi_program_tuple_dict[(key, program_key)]
+                if start_arr.shape[0] < self.__seq_len:
                     continue
 
-                row = np.random.uniform(
-                    low=midi_df.start.min(), 
-                    high=midi_df.end.max() - (self.__seq_len * self.__time_fraction)
-                )
+                row = row_low + (row_arr[batch, i] * (row_high - row_low))
+                boundary_arr = row + self.__seq_boundary_arr
+                left_arr = np.searchsorted(start_arr, boundary_arr[:-1], side="left")
+                right_arr = np.searchsorted(start_arr, boundary_arr[1:], side="right")
                 for seq in range(self.__seq_len):
-                    start = row + (seq * self.__time_fraction)
-                    end = row + ((seq+1) * self.__time_fraction)
-                    df = midi_df[(start <= midi_df.start) & (midi_df.start <= end)]
-                    sampled_arr[batch, i, seq] = self.__convert_into_feature(df)
+                    sampled_arr[batch, i, seq] = self.__convert_into_feature(
+                        pitch_arr[left_arr[seq]:right_arr[seq]]
+                    )
 
         return sampled_arr
 
-    def __convert_into_feature(self, df):
-        arr = self.__bar_gram.extract_features(df)
-        return arr.reshape(1, -1).astype(float)
+    def __convert_into_feature(self, pitch_arr):
+        arr = self.__bar_gram.extract_features_by_pitch_arr(pitch_arr)
+        return arr.reshape(1, -1)
 
     def set_readonly(self, value):
         ''' setter '''
@@ -31,12 +31,35 @@ class MidiTrueSampler(TrueSampler):
             max_pitch:          The maximum of note number.
         '''
         self.__midi_df_list = midi_df_list
+
+        program_arr_list = []
+        midi_program_tuple_dict = {}
+        for key in range(len(self.__midi_df_list)):
+            midi_df = self.__midi_df_list[key]
+            program_arr = midi_df.program.drop_duplicates().values
+            program_arr_list.append(program_arr)
+            for program_key in program_arr:
+                program_df = midi_df[midi_df.program == program_key]
+                program_df = program_df.sort_values(by=["start"], kind="stable")
+                start_arr = program_df.start.values
+                midi_program_tuple_dict[(key, program_key)] = (
+                    start_arr,
+                    program_df.pitch.values,
+                    start_arr[0],
+                    program_df.end.max() - (seq_len * time_fraction)
+                )
+        self.__program_arr_list = program_arr_list
+        self.__midi_program_tuple_dict = midi_program_tuple_dict
+
         self.__batch_size = batch_size
         self.__seq_len = seq_len
         self.__time_fraction = time_fraction
         self.__min_pitch = min_pitch
         self.__max_pitch = max_pitch
+        self.__max_pitch_minus_one = max_pitch - 1
         self.__dim = self.__max_pitch - self.__min_pitch
+        self.__seq_boundary_arr = np.arange(seq_len + 1) * time_fraction
+        self.__sampled_buffer = None
 
     def draw(self):
         '''
@@ -45,35 +68,43 @@ class MidiTrueSampler(TrueSampler):
         Returns:
             `np.ndarray` of samples.
         '''
-        sampled_arr = np.empty((self.__batch_size, self.__seq_len, self.__dim))
+        if self.__sampled_buffer is None:
+            self.__sampled_buffer = np.empty(
+                (self.__batch_size, self.__seq_len, self.__dim),
+                dtype=np.float32
+            )
+        sampled_arr = self.__sampled_buffer
+
+        key_arr = np.random.randint(low=0, high=len(self.__midi_df_list), size=self.__batch_size)
+        program_uniform_arr = np.random.uniform(size=self.__batch_size)
+        row_arr = np.random.uniform(size=self.__batch_size)
 
         for batch in range(self.__batch_size):
-            key = np.random.randint(low=0, high=len(self.__midi_df_list))
-            midi_df = self.__midi_df_list[key]
-            program_arr = midi_df.program.drop_duplicates().values
-            key = np.random.randint(low=0, high=program_arr.shape[0])
-            program_key = program_arr[key]
-            midi_df = midi_df[midi_df.program == program_key]
-            if midi_df.shape[0] < self.__seq_len:
+            key = key_arr[batch]
+            program_arr = self.__program_arr_list[key]
+            program_key = program_arr[int(program_uniform_arr[batch] * program_arr.shape[0])]
+            start_arr, pitch_arr, row_low, row_high = self.__midi_program_tuple_dict[(key, program_key)]
+            if start_arr.shape[0] < self.__seq_len:
                 raise ValueError("The length of musical performance (program: " + str(program_key) + " is short.")
 
-            row = np.random.uniform(
-                low=midi_df.start.min(), 
-                high=midi_df.end.max() - (self.__seq_len * self.__time_fraction)
-            )
-            for seq in range(self.__seq_len):
-                start = row + (seq * self.__time_fraction)
-                end = row + ((seq+1) * self.__time_fraction)
-                df = midi_df[(start <= midi_df.start) & (midi_df.start <= end)]
-                sampled_arr[batch, seq] = self.__convert_into_feature(df)
+            row = row_low + (row_arr[batch] * (row_high - row_low))
+            boundary_arr = row + self.__seq_boundary_arr
+            left_arr = np.searchsorted(start_arr, boundary_arr[:-1], side="left")
+            right_arr = np.searchsorted(start_arr, boundary_arr[1:], side="right")
+            sampled_arr[batch] = self.__convert_into_feature(pitch_arr, left_arr, right_arr)
 
         return sampled_arr
 
-    def __convert_into_feature(self, df):
-        arr = np.zeros(self.__dim)
-        for i in range(df.shape[0]):
-            if df.pitch.values[i] < self.__max_pitch - 1:
-                if df.pitch.values[i] - self.__min_pitch >= 0:
-                    arr[df.pitch.values[i] - self.__min_pitch] = 1
+    def __convert_into_feature(self, pitch_arr, left_arr, right_arr):
+        count_arr = right_arr - left_arr
+        seq_key_arr = np.repeat(np.arange(self.__seq_len), count_arr)
+        offset_arr = np.repeat(
+            left_arr - np.concatenate(([0], np.cumsum(count_arr)[:-1])),
+            count_arr
+        )
+        pitch_arr = pitch_arr[np.arange(count_arr.sum()) + offset_arr]
+        key_arr = (pitch_arr < self.__max_pitch_minus_one) & (pitch_arr - self.__min_pitch >= 0)
+        arr = np.zeros((self.__seq_len, self.__dim), dtype=np.float32)
+        arr[seq_key_arr[key_arr], pitch_arr[key_arr] - self.__min_pitch] = 1
 
-        return arr.reshape(1, -1).astype(float)
+        return arr
@@ -104,10 +104,7 @@ class QuantumMonteCarlo(AnnealingModel):
             arr[arr == 0] = -1
             key_arr = np.arange(self.__mc_step) % self.__point_num
             np.random.shuffle(key_arr)
-            spin_arr_list = [None] * self.__trotter_dimention
-            for i in range(self.__trotter_dimention):
-                spin_arr_list[i] = arr[key_arr]
-            self.__spin_arr = np.array(spin_arr_list)
+            self.__spin_arr = np.tile(arr[key_arr], (self.__trotter_dimention, 1, 1))
 
     def annealing(self):
         '''
@@ -115,8 +112,17 @@ class QuantumMonteCarlo(AnnealingModel):
         '''
         self.__predicted_log_list = []
         for cycle in range(self.__cycles_num):
+            torotter_arr = np.random.randint(self.__trotter_dimention, size=self.__mc_step)
+            pre_time_arr = np.random.randint(self.__mc_step, size=self.__mc_step)
+            post_time_arr = (
+                pre_time_arr + 1 + np.random.randint(self.__mc_step - 1, size=self.__mc_step)
+            ) % self.__mc_step
             for mc_step in range(self.__mc_step):
-                self.__move()
+                self.__move(
+                    torotter_arr[mc_step],
+                    pre_time_arr[mc_step],
+                    post_time_arr[mc_step]
+                )
             self.__gammma *= self.__fractional_reduction
 
             if isinstance(self.__tolerance_diff_e, float) and len(self.__predicted_log_list) > 1:
@@ -126,15 +132,7 @@ class QuantumMonteCarlo(AnnealingModel):
 
         self.predicted_log_arr = np.array(self.__predicted_log_list)
 
-    def __move(self):
-        # Choice torotter.
-        torotter = np.random.randint(self.__trotter_dimention)
-        
-        # Choice times.
-        time_arr = np.arange(self.__mc_step)
-        np.random.shuffle(time_arr)
-        pre_time, post_time = (time_arr[0], time_arr[1])
-        
+    def __move(self, torotter, pre_time, post_time):
         # Decide point.
         pre_point = self.__spin_arr[torotter, pre_time].argmax()
         post_point = self.__spin_arr[torotter, post_time].argmax()